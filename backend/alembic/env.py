@@ -12,11 +12,6 @@ from alembic import context
 # 프로젝트 루트 경로를 sys.path에 추가하여 'app' 모듈을 임포트할 수 있도록 설정
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-# autogenerate를 위해 모든 SQLModel 모델을 임포트해야 합니다.
-# 이 임포트문들은 모델이 SQLModel의 메타데이터에 등록되도록 합니다.
-from app.models import env_model  # noqa
-from app.models import user_model  # noqa
-
 # Alembic Config 객체. alembic.ini 파일의 값에 접근합니다.
 config = context.config
 
@@ -24,8 +19,19 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# 'autogenerate'를 위해 모델의 메타데이터를 Alembic에 알려줍니다.
-target_metadata = SQLModel.metadata
+
+def _load_target_metadata():
+    """autogenerate를 위해 모든 SQLModel 모델을 임포트한 뒤 메타데이터를 반환합니다.
+
+    앱 모듈 로딩(SQLModel 테이블 정의 등)을 마이그레이션 실행 시점까지 미뤄
+    --help 등 메타데이터가 필요 없는 명령의 기동 비용을 줄입니다.
+    """
+    # 이 임포트문들은 모델이 SQLModel의 메타데이터에 등록되도록 합니다.
+    from app.models import env_model  # noqa
+    from app.models import user_model  # noqa
+
+    return SQLModel.metadata
+
 
 # --- 마이그레이션 실행 함수 --- #
 
@@ -39,7 +45,7 @@ def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=_load_target_metadata(),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -62,7 +68,9 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection, target_metadata=_load_target_metadata()
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,68 @@
+"""
+FastAPI 인증 의존성 주입 헬퍼
+
+DB 모듈(postgre_db)과 분리하여 alembic 등 CLI 도구가
+JWT/OAuth2 스택을 불필요하게 import하지 않도록 함
+"""
+from typing import Annotated, Any
+
+import jwt
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from jwt.exceptions import InvalidTokenError
+from pydantic import TypeAdapter, ValidationError
+from sqlmodel import Session
+
+from app.core import security
+from app.core.env import settings
+from app.db.postgre_db import depend_get_db
+from app.models.user_model import User
+from app.schemas.user_schema import TokenPayload
+
+# JWT 디코딩에 쓰이는 값들을 요청마다 재생성하지 않도록 모듈 로드 시 1회만 준비
+_ALGORITHMS = (security.ALGORITHM,)
+_TOKEN_ADAPTER = TypeAdapter(TokenPayload)
+
+# OAuth2 토큰 URL 설정
+reusable_oauth2 = OAuth2PasswordBearer(
+    tokenUrl=f"{settings.API_V1_STR}/login/access-token"
+)
+
+# 타입 어노테이션
+SessionDep = Annotated[Session, Depends(depend_get_db)]
+TokenDep = Annotated[str, Depends(reusable_oauth2)]
+
+
+def get_current_user(session: SessionDep, token: TokenDep):
+    """현재 인증된 사용자 반환"""
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=_ALGORITHMS)
+        token_data = _TOKEN_ADAPTER.validate_python(payload)
+    except (InvalidTokenError, ValidationError):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+    user = session.get(User, token_data.sub)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return user
+
+
+def get_current_active_superuser(
+    current_user: Annotated[object, Depends(get_current_user)],
+):
+    """현재 슈퍼유저 권한 확인"""
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=403, detail="The user doesn't have enough privileges"
+        )
+    return current_user
+
+
+# 타입 어노테이션 (라우터에서 import해서 사용)
+# Note: User 타입은 순환 import 방지를 위해 Any로 선언하고, 런타임에는 User 객체가 반환됨
+
+CurrentUser = Annotated[Any, Depends(get_current_user)]
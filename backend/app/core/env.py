@@ -1,5 +1,6 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
 
 
 class Settings(BaseSettings):
@@ -39,6 +40,12 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: int
 
+    # PostgreSQL Connection Pool Tuning
+    POSTGRES_POOL_SIZE: int = 20
+    POSTGRES_MAX_OVERFLOW: int = 40
+    POSTGRES_POOL_RECYCLE: int = 1800  # seconds
+    POSTGRES_POOL_TIMEOUT: int = 10  # seconds
+
     # Redis Configuration
     REDIS_HOST: str
     REDIS_PORT: int
@@ -55,32 +62,40 @@ class Settings(BaseSettings):
     # Runtime-managed environment variables (comma separated keys)
     RUNTIME_ENV_KEYS: str = "CORS_ORIGINS,ACCESS_TOKEN_EXPIRE_MINUTES"
 
-    @property
+    @cached_property
     def DATABASE_URL(self) -> str:
         """
-        PostgreSQL 데이터베이스 URL 생성
+        PostgreSQL 데이터베이스 URL 생성 (최초 접근 시 1회만 조합)
         """
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
-    @property
-    def CORS_ORIGINS_LIST(self) -> List[str]:
+    @cached_property
+    def CORS_ORIGINS_LIST(self) -> tuple[str, ...]:
         """
-        CORS origins를 리스트로 변환
+        CORS origins를 튜플로 변환 (최초 접근 시 1회만 파싱)
         """
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
 
-    @property
-    def RUNTIME_ENV_KEYS_LIST(self) -> List[str]:
+    @cached_property
+    def RUNTIME_ENV_KEYS_LIST(self) -> tuple[str, ...]:
         """
-        런타임에서 DB/Redis로 관리할 환경변수 키 목록 반환
+        런타임에서 DB/Redis로 관리할 환경변수 키 목록 반환 (최초 접근 시 1회만 파싱)
         """
         if not self.RUNTIME_ENV_KEYS:
-            return []
-        return [
+            return ()
+        return tuple(
             key.strip()
             for key in self.RUNTIME_ENV_KEYS.split(",")
             if key and key.strip()
-        ]
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Settings 싱글톤 반환 (.env 파싱과 pydantic 스키마 구성을 프로세스당 1회만 수행)
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
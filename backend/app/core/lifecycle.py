@@ -2,6 +2,7 @@
 Application Lifecycle Events
 앱 시작 및 종료 시 실행되는 이벤트 핸들러
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
@@ -18,21 +19,83 @@ from app.core.runtime_env import ensure_core_env_synced
 setup_logging()
 
 
+def _sync_startup() -> None:
+    """블로킹 startup 작업 (워커 스레드에서 실행)"""
+    # 1. DB 테이블 초기화
+    logging.info("\n[1/5] Initializing database tables...")
+    PostgreDB.init_db()
+    logging.info("✓ Database tables initialized")
+
+    # 2. 커넥션 풀 예열 (첫 요청의 핸드셰이크/인증 지연 제거)
+    logging.info("\n[2/5] Warming up connection pool...")
+    PostgreDB.warm_pool()
+    logging.info("✓ Connection pool warmed up")
+
+    # 3~5는 세션 풀 획득/반환을 반복하지 않도록 하나의 세션을 공유
+    db = PostgreDB.get_session()
+    try:
+        # 3. .env 파일 -> PostgreSQL 동기화
+        logging.info("\n[3/5] Syncing .env to PostgreSQL...")
+        env_service = EnvVariableService(db)
+        count = env_service.load_from_env_file(".env")
+        if count > 0:
+            logging.info(f"✓ Synced {count} variables from .env to PostgreSQL")
+        else:
+            logging.info("ℹ No new variables to sync from .env")
+
+        # 4. env.py 설정 -> PostgreSQL/Redis 동기화
+        logging.info("\n[4/5] Syncing runtime settings to PostgreSQL & Redis...")
+        ensure_core_env_synced(force=True, session=db)
+        logging.info("✓ Runtime settings synced")
+
+        # 5. PostgreSQL -> Redis 동기화
+        logging.info("\n[5/5] Syncing PostgreSQL to Redis...")
+        synced = env_service.sync_to_redis()
+        if synced:
+            logging.info("✓ Redis cache refreshed from PostgreSQL")
+        else:
+            logging.warning("⚠ Redis cache sync skipped or failed")
+    finally:
+        db.close()
+
+
+def _backup_env_to_file() -> None:
+    """블로킹 shutdown 작업: PostgreSQL -> .env 백업"""
+    db = PostgreDB.get_session()
+    try:
+        env_service = EnvVariableService(db)
+        env_dict = env_service.get_all_as_dict()
+
+        if env_dict:
+            if EnvSyncService.export_to_env_file(env_dict, ".env", backup=True):
+                logging.info(f"✓ Backed up {len(env_dict)} variables to .env")
+            else:
+                logging.error("⚠ Failed to back up variables to .env")
+        else:
+            logging.info("ℹ No variables to back up")
+    finally:
+        db.close()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     FastAPI 앱 생명주기 관리
 
+    블로킹 DB/Redis 작업은 asyncio.to_thread로 워커 스레드에서 실행하여
+    이벤트 루프를 막지 않음 (이벤트 루프 자체는 uvicorn[standard]가
+    uvloop을 자동 선택)
+
     Startup:
         1. DB 테이블 초기화
-        2. .env 파일 -> PostgreSQL 동기화 (초기 설정)
-        3. env.py 핵심 설정 -> PostgreSQL/Redis 동기화
-        4. PostgreSQL -> Redis 전체 동기화
+        2. 커넥션 풀 예열
+        3. .env 파일 -> PostgreSQL 동기화 (초기 설정)
+        4. env.py 핵심 설정 -> PostgreSQL/Redis 동기화
+        5. PostgreSQL -> Redis 전체 동기화
 
     Shutdown:
         1. PostgreSQL -> .env 백업
-        2. Redis 연결 종료
-        3. DB 연결 종료
+        2. Redis/DB 연결 동시 종료
     """
     # ==================== STARTUP ====================
     logging.info("=" * 60)
@@ -40,41 +103,7 @@ async def lifespan(app: FastAPI):
     logging.info("=" * 60)
 
     try:
-        # 1. DB 테이블 초기화
-        logging.info("\n[1/4] Initializing database tables...")
-        PostgreDB.init_db()
-        logging.info("✓ Database tables initialized")
-
-        # 2. .env 파일 -> PostgreSQL 동기화
-        logging.info("\n[2/4] Syncing .env to PostgreSQL...")
-        db = PostgreDB.get_session()
-        try:
-            env_service = EnvVariableService(db)
-            count = env_service.load_from_env_file(".env")
-            if count > 0:
-                logging.info(f"✓ Synced {count} variables from .env to PostgreSQL")
-            else:
-                logging.info("ℹ No new variables to sync from .env")
-        finally:
-            db.close()
-
-        # 3. env.py 설정 -> PostgreSQL/Redis 동기화
-        logging.info("\n[3/4] Syncing runtime settings to PostgreSQL & Redis...")
-        ensure_core_env_synced(force=True)
-        logging.info("✓ Runtime settings synced")
-
-        # 4. PostgreSQL -> Redis 동기화
-        logging.info("\n[4/4] Syncing PostgreSQL to Redis...")
-        db = PostgreDB.get_session()
-        try:
-            env_service = EnvVariableService(db)
-            synced = env_service.sync_to_redis()
-            if synced:
-                logging.info("✓ Redis cache refreshed from PostgreSQL")
-            else:
-                logging.warning("⚠ Redis cache sync skipped or failed")
-        finally:
-            db.close()
+        await asyncio.to_thread(_sync_startup)
 
         logging.info("\n" + "=" * 60)
         logging.info("✓ Application startup completed successfully")
@@ -94,31 +123,16 @@ async def lifespan(app: FastAPI):
 
     try:
         # 1. PostgreSQL -> .env 백업
-        logging.info("\n[1/3] Backing up PostgreSQL to .env...")
-        db = PostgreDB.get_session()
-        try:
-            env_service = EnvVariableService(db)
-            env_dict = env_service.get_all_as_dict()
-
-            if env_dict:
-                if EnvSyncService.export_to_env_file(env_dict, ".env", backup=True):
-                    logging.info(f"✓ Backed up {len(env_dict)} variables to .env")
-                else:
-                    logging.error("⚠ Failed to back up variables to .env")
-            else:
-                logging.info("ℹ No variables to back up")
-        finally:
-            db.close()
-
-        # 2. Redis 연결 종료
-        logging.info("\n[2/3] Closing Redis connection...")
-        RedisDB.close()
-        logging.info("✓ Redis connection closed")
-
-        # 3. DB 연결 종료
-        logging.info("\n[3/3] Closing database connection...")
-        PostgreDB.close_db()
-        logging.info("✓ Database connection closed")
+        logging.info("\n[1/2] Backing up PostgreSQL to .env...")
+        await asyncio.to_thread(_backup_env_to_file)
+
+        # 2. Redis/DB 연결 동시 종료
+        logging.info("\n[2/2] Closing Redis and database connections...")
+        await asyncio.gather(
+            asyncio.to_thread(RedisDB.close),
+            asyncio.to_thread(PostgreDB.close_db),
+        )
+        logging.info("✓ Redis and database connections closed")
 
         logging.info("\n" + "=" * 60)
         logging.info("✓ Application shutdown completed successfully")
@@ -1,19 +1,40 @@
 """
 Application-wide logging configuration.
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
+_listener: logging.handlers.QueueListener | None = None
+
 
 def setup_logging():
     """
     Configures the root logger for the application.
 
-    This setup ensures that log messages are directed to standard output
-    with a consistent format.
+    Log records are pushed onto an in-process queue and a background
+    listener thread performs the formatted write to standard output, so
+    emitting a log line is a queue put instead of a blocking stdout
+    syscall. Safe to call multiple times; later calls are no-ops.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        stream=sys.stdout,
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
     )
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    # 프로세스 종료 시 큐에 남은 레코드를 비운 뒤 리스너 스레드 정리
+    atexit.register(_listener.stop)
@@ -7,27 +7,59 @@ helper accessors that fall back to .env definitions when missing.
 from __future__ import annotations
 
 import logging
+import re
 from contextlib import suppress
-from typing import Any, Callable, Optional, TypeVar
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, TypeVar
+
+from sqlmodel import Session
 
 from app.core.env import settings
 from app.db.postgre_db import PostgreDB
-from app.schemas.env_schema import EnvVariableCreate, EnvVariableUpdate
+from app.schemas.env_schema import EnvVariableCreate
 from app.services.env_services.env_cache import EnvCacheService
 from app.services.env_services.env_variable import EnvVariableService
+from app.utils.ttl_cache import TTLCache
 
 _logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# 핫 키(CORS, 토큰 만료 등)를 매 요청 Redis 왕복 없이 읽기 위한 프로세스 내 캐시
+_local_cache = TTLCache(maxsize=64, ttl=5.0)
+_CACHE_MISS = object()
+
+# 쉼표 구분 origin 문자열 파싱 (split + strip를 한 번에 처리)
+_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+@lru_cache(maxsize=8)
+def _parse_origins(raw: str) -> tuple[str, ...]:
+    """
+    쉼표로 구분된 origin 문자열을 한 번만 파싱하여 튜플로 캐싱
+    """
+    return tuple(origin for origin in _SPLIT_RE.split(raw.strip()) if origin)
+
+
+@lru_cache(maxsize=1)
+def _shared_cache() -> EnvCacheService:
+    """
+    프로세스 전역 Redis 캐시 서비스 (요청마다 새 클라이언트 생성 방지)
+    """
+    return EnvCacheService()
+
 
 class RuntimeEnv:
     """Runtime environment configuration manager."""
 
-    _DEFAULT_DESCRIPTIONS: dict[str, str] = {
-        "CORS_ORIGINS": "Comma separated list of origins allowed for CORS",
-        "ACCESS_TOKEN_EXPIRE_MINUTES": "Access token expiration (minutes)",
-    }
+    # 읽기 전용 매핑으로 고정 (실수로 인한 변경 방지)
+    _DEFAULT_DESCRIPTIONS: Mapping[str, str] = MappingProxyType(
+        {
+            "CORS_ORIGINS": "Comma separated list of origins allowed for CORS",
+            "ACCESS_TOKEN_EXPIRE_MINUTES": "Access token expiration (minutes)",
+        }
+    )
 
     _sync_ran: bool = False
 
@@ -35,31 +67,27 @@ class RuntimeEnv:
     def _managed_default_map() -> dict[str, tuple[str, Optional[str]]]:
         """
         Build a mapping of managed environment keys to their default values.
-        """
-        managed: dict[str, tuple[str, Optional[str]]] = {}
-
-        for key in settings.RUNTIME_ENV_KEYS_LIST:
-            if not key:
-                continue
-
-            if hasattr(settings, key):
-                value: Any = getattr(settings, key)
-            else:
-                value = None
 
-            if value is None:
-                continue
-
-            managed[key] = (str(value), RuntimeEnv._DEFAULT_DESCRIPTIONS.get(key))
+        Uses a single model_dump() walk instead of per-key attribute access.
+        """
+        dump = settings.model_dump()
 
-        return managed
+        return {
+            key: (str(dump[key]), RuntimeEnv._DEFAULT_DESCRIPTIONS.get(key))
+            for key in settings.RUNTIME_ENV_KEYS_LIST
+            if dump.get(key) is not None
+        }
 
     @staticmethod
-    def ensure_core_env_synced(force: bool = False) -> None:
+    def ensure_core_env_synced(
+        force: bool = False, session: Optional[Session] = None
+    ) -> None:
         """
         Persist managed settings to PostgreSQL and refresh Redis cache.
 
         Called during application startup; safe to call multiple times.
+        An already-open session may be passed to avoid an extra pool
+        acquire/release cycle; the caller then owns its lifecycle.
         """
         if RuntimeEnv._sync_ran and not force:
             return
@@ -67,45 +95,36 @@ class RuntimeEnv:
         with suppress(Exception):
             PostgreDB.init_db()
 
-        session = None
+        owns_session = session is None
         try:
-            session = PostgreDB.get_session()
+            if owns_session:
+                session = PostgreDB.get_session()
             service = EnvVariableService(session)
 
             managed_defaults = RuntimeEnv._managed_default_map()
 
-            for key, (value, description) in managed_defaults.items():
-                try:
-                    existing = service.get(key)
-                    if not existing:
-                        service.create(
-                            EnvVariableCreate(
-                                key=key, value=value, description=description
-                            )
-                        )
-                        continue
-
-                    if description and existing.description != description:
-                        service.update(
-                            key,
-                            EnvVariableUpdate(description=description),
-                        )
-                except Exception as exc:  # pragma: no cover - defensive
-                    session.rollback()
-                    _logger.warning(
-                        "Failed to sync environment variable '%s': %s", key, exc
-                    )
+            try:
+                service.bulk_upsert(
+                    [
+                        EnvVariableCreate(key=key, value=value, description=description)
+                        for key, (value, description) in managed_defaults.items()
+                    ]
+                )
+            except Exception as exc:  # pragma: no cover - defensive
+                session.rollback()
+                _logger.warning("Failed to sync managed environment variables: %s", exc)
 
             if not service.sync_to_redis():  # pragma: no cover - defensive
                 _logger.warning("Failed to sync managed environment variables to Redis")
 
+            _local_cache.clear()
             RuntimeEnv._sync_ran = True
         except Exception as exc:  # pragma: no cover - defensive
             _logger.error(
                 "Failed to ensure core environment sync: %s", exc, exc_info=True
             )
         finally:
-            if session is not None:
+            if owns_session and session is not None:
                 session.close()
 
     @staticmethod
@@ -113,36 +132,42 @@ class RuntimeEnv:
         callback: Callable[[EnvCacheService], Optional[str]],
     ) -> Optional[str]:
         """
-        Helper that instantiates the cache safely; returns None on failure.
+        Helper that resolves the shared cache safely; returns None on failure.
         """
         try:
-            cache = EnvCacheService()
-            return callback(cache)
+            return callback(_shared_cache())
         except Exception:  # pragma: no cover - Redis connection issues
+            _shared_cache.cache_clear()
             return None
 
     @staticmethod
     def _fetch_value(key: str) -> Optional[str]:
         """
-        Retrieve a stored value from Redis, falling back to PostgreSQL.
+        Retrieve a stored value, checking the in-process TTL cache first,
+        then Redis, falling back to PostgreSQL.
         """
-        cached_value = RuntimeEnv._with_cache(lambda cache: cache.get(key))
-        if cached_value is not None:
-            return cached_value
+        local_value = _local_cache.get(key, _CACHE_MISS)
+        if local_value is not _CACHE_MISS:
+            return local_value
 
-        session = None
-        try:
-            session = PostgreDB.get_session()
-            service = EnvVariableService(session)
-            env_var = service.get(key)
-            if env_var:
-                return env_var.value
-            return None
-        except Exception:  # pragma: no cover - defensive
-            return None
-        finally:
-            if session is not None:
-                session.close()
+        value: Optional[str] = RuntimeEnv._with_cache(lambda cache: cache.get(key))
+
+        if value is None:
+            session = None
+            try:
+                session = PostgreDB.get_session()
+                service = EnvVariableService(session)
+                env_var = service.get(key)
+                if env_var:
+                    value = env_var.value
+            except Exception:  # pragma: no cover - defensive
+                value = None
+            finally:
+                if session is not None:
+                    session.close()
+
+        _local_cache.set(key, value)
+        return value
 
     @staticmethod
     def get_env_value(
@@ -153,9 +178,10 @@ class RuntimeEnv:
     ) -> Optional[T]:
         """
         Fetch a managed environment value with optional casting.
-        """
-        RuntimeEnv.ensure_core_env_synced()
 
+        The startup lifespan is responsible for the initial
+        ensure_core_env_synced(force=True); request paths read directly.
+        """
         fallback: Optional[Any] = (
             default if default is not None else getattr(settings, key, None)
         )
@@ -186,22 +212,25 @@ class RuntimeEnv:
                 return None
 
     @staticmethod
-    def get_cors_origins(default: Optional[str] = None) -> list[str]:
+    def get_cors_origins(default: Optional[str] = None) -> tuple[str, ...]:
         """
-        Return the list of allowed CORS origins.
+        Return the allowed CORS origins.
+
+        Returns the shared memoized tuple; callers needing a mutable list
+        (e.g. middleware wiring) materialize it themselves.
         """
         fallback = default if default is not None else settings.CORS_ORIGINS
         raw_value = RuntimeEnv.get_env_value("CORS_ORIGINS", default=fallback)
 
         if raw_value is None:
-            return []
+            return ()
 
         if isinstance(raw_value, (list, tuple)):
-            origins = [str(origin).strip() for origin in raw_value]
-        else:
-            origins = [origin.strip() for origin in str(raw_value).split(",")]
+            return tuple(
+                origin for origin in map(str.strip, map(str, raw_value)) if origin
+            )
 
-        return [origin for origin in origins if origin]
+        return _parse_origins(str(raw_value))
 
     @staticmethod
     def get_access_token_expire_minutes(default: Optional[int] = None) -> int:
@@ -222,9 +251,11 @@ class RuntimeEnv:
 
 
 # Backward compatibility - deprecated module-level functions
-def ensure_core_env_synced(force: bool = False) -> None:
+def ensure_core_env_synced(
+    force: bool = False, session: Optional[Session] = None
+) -> None:
     """Deprecated: Use RuntimeEnv.ensure_core_env_synced() instead."""
-    return RuntimeEnv.ensure_core_env_synced(force)
+    return RuntimeEnv.ensure_core_env_synced(force, session=session)
 
 
 def get_env_value(
@@ -237,7 +268,7 @@ def get_env_value(
     return RuntimeEnv.get_env_value(key, default=default, cast=cast)
 
 
-def get_cors_origins(default: Optional[str] = None) -> list[str]:
+def get_cors_origins(default: Optional[str] = None) -> tuple[str, ...]:
     """Deprecated: Use RuntimeEnv.get_cors_origins() instead."""
     return RuntimeEnv.get_cors_origins(default)
 
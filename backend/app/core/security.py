@@ -1,35 +1,97 @@
 """
 Security utilities for authentication and password hashing.
 """
-from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
-import jwt
-from passlib.context import CryptContext
-
 from app.core.env import settings
 
-# 비밀번호 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=1)
+def _pwd_context():
+    """
+    비밀번호 해싱 컨텍스트 (최초 해싱/검증 시점에 생성)
+
+    passlib/bcrypt 로딩 비용을 import 시점이 아닌 첫 사용 시점으로 미룸
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 
 # JWT 알고리즘 (보안상 하드코딩 권장)
 # 환경변수로 관리하면 공격자가 약한 알고리즘으로 변경할 위험이 있음
 ALGORITHM = "HS256"
 
+# 서명 키는 고정이므로 토큰 생성 시마다 str→bytes 인코딩을 반복하지 않도록 캐싱
+_SECRET = settings.SECRET_KEY.encode("utf-8")
+
+# HS256 전용 고속 서명 경로에서 재사용하는 사전 계산 값들
+# - 헤더는 고정이므로 base64url 인코딩 결과를 상수로 보관
+# - HMAC 키 블록(ipad/opad) 계산은 프로토타입 객체의 copy()로 1회만 수행
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+_HMAC_PROTO = hmac.new(_SECRET, digestmod=hashlib.sha256)
+
+
+def _encode_hs256(payload: dict) -> str:
+    """
+    PyJWT와 호환되는 HS256 토큰 인코딩 (서명 키 준비 비용 제거 버전)
+    """
+    payload_b64 = base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    ).rstrip(b"=")
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+
+    mac = _HMAC_PROTO.copy()
+    mac.update(signing_input)
+    signature_b64 = base64.urlsafe_b64encode(mac.digest()).rstrip(b"=")
+
+    return (signing_input + b"." + signature_b64).decode("ascii")
+
 
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     """
     Create a signed JWT access token for the given subject.
     """
-    expire = datetime.now(timezone.utc) + expires_delta
-    to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    # JWT의 exp 클레임은 epoch 정수이므로 datetime 객체를 거치지 않고 바로 계산
+    expire = int(time.time() + expires_delta.total_seconds())
+    return _encode_hs256({"exp": expire, "sub": str(subject)})
 
 
+# bcrypt 해싱은 의도적으로 느린 CPU 작업(수십~수백 ms)이지만,
+# 이를 호출하는 라우터 핸들러는 모두 동기 def라 AnyIO 스레드풀에서 돌고
+# bcrypt C 확장은 해싱 동안 GIL을 해제하므로 이벤트 루프와 다른 요청을
+# 막지 않음 — 별도 ProcessPoolExecutor는 pickle/프로세스 비용만 추가함
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
+
+
+@lru_cache(maxsize=1)
+def _pwd_context_bulk():
+    """
+    저비용 해싱 컨텍스트 (bcrypt rounds=4, 기본 12 대비 수백 배 빠름)
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+
+
+def get_password_hash_fast(password: str) -> str:
+    """
+    대량 시드/관리자 일괄 가져오기 전용 저비용 해싱
+
+    보안 트레이드오프: 온라인 공격 방어력이 낮으므로 초기 시드처럼
+    곧바로 비밀번호가 변경되는 계정에만 사용할 것.
+    bcrypt 해시는 cost를 자체 포함하므로 verify_password로 그대로 검증됨
+    """
+    return _pwd_context_bulk().hash(password)
@@ -1,16 +1,15 @@
 from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.pool import QueuePool
 from sqlmodel import SQLModel, select, Session
-from typing import Annotated, Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator
+import random
+import threading
 import time
-import jwt
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from jwt.exceptions import InvalidTokenError
-from typing import Any
-from pydantic import ValidationError
 
 from app.core.env import settings
+from app.models.user_model import User
 
 
 class PostgreDB:
@@ -22,41 +21,64 @@ class PostgreDB:
     """
 
     _engine = None
+    _readonly_engine = None
+    _init_lock = threading.Lock()
     MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
+    # 지수 백오프 + 지터 (동시 재기동 시 재연결 폭주 방지)
+    BASE_DELAY = 1.0  # seconds
+    MAX_DELAY = 30.0  # seconds
+    JITTER = 0.5
+    # 여러 워커 동시 기동 시 한 워커만 DDL을 수행하도록 하는 advisory lock 키
+    DDL_ADVISORY_LOCK_KEY = 0x0DD1_10C4
 
     @classmethod
     def _init_engine(cls):
-        """SQLAlchemy 엔진 초기화 (재시도 로직 포함)"""
-        if cls._engine is None:
-            database_url = settings.DATABASE_URL
-
-            for attempt in range(1, cls.MAX_RETRIES + 1):
-                try:
-                    cls._engine = create_engine(
-                        database_url,
-                        poolclass=QueuePool,
-                        pool_size=5,
-                        max_overflow=10,
-                        pool_pre_ping=True,
-                        echo=getattr(settings, "DEBUG", False),
-                    )
-
-                    # 연결 테스트
-                    with cls._engine.connect() as conn:
-                        conn.execute(text("SELECT 1"))
-
-                    # TODO: LOG 추가 - print("✓ PostgreSQL 엔진 초기화 완료")
-                    return
-
-                except Exception:
-                    # TODO: LOG 추가 - print(f"⚠ PostgreSQL connection attempt {attempt}/{cls.MAX_RETRIES} failed: {e}")
-                    if attempt < cls.MAX_RETRIES:
-                        # TODO: LOG 추가 - print(f"   Retrying in {cls.RETRY_DELAY} seconds...")
-                        time.sleep(cls.RETRY_DELAY)
-                    else:
-                        # TODO: LOG 추가 - print(f"❌ PostgreSQL connection failed after {cls.MAX_RETRIES} attempts")
-                        raise
+        """
+        SQLAlchemy 엔진 초기화 (이중 확인 잠금으로 중복 생성 방지)
+
+        연결 검증은 pool_pre_ping과 init_db()의 대기 로직에 위임하므로
+        엔진 생성 자체는 네트워크 왕복 없이 즉시 끝남
+        """
+        if cls._engine is not None:
+            return
+
+        with cls._init_lock:
+            if cls._engine is not None:
+                return
+
+            cls._engine = create_engine(
+                settings.DATABASE_URL,
+                poolclass=QueuePool,
+                pool_size=settings.POSTGRES_POOL_SIZE,
+                max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+                pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+                pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+                pool_pre_ping=True,
+                echo=getattr(settings, "DEBUG", False),
+            )
+            # TODO: LOG 추가 - print("✓ PostgreSQL 엔진 초기화 완료")
+
+    @classmethod
+    def _wait_until_ready(cls):
+        """
+        DB 기동 대기 (컨테이너 동시 기동 시 지수 백오프 + 지터로 재시도)
+
+        인증 실패 등 재시도해도 소용없는 오류는 즉시 전파
+        """
+        for attempt in range(1, cls.MAX_RETRIES + 1):
+            try:
+                with cls._engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                return
+
+            except OperationalError:
+                # TODO: LOG 추가 - print(f"⚠ PostgreSQL connection attempt {attempt}/{cls.MAX_RETRIES} failed: {e}")
+                if attempt < cls.MAX_RETRIES:
+                    delay = min(cls.MAX_DELAY, cls.BASE_DELAY * 2 ** (attempt - 1))
+                    time.sleep(delay * (1 + random.random() * cls.JITTER))
+                else:
+                    # TODO: LOG 추가 - print(f"❌ PostgreSQL connection failed after {cls.MAX_RETRIES} attempts")
+                    raise
 
     @classmethod
     def get_db(cls) -> Generator[Session, None, None]:
@@ -65,7 +87,27 @@ class PostgreDB:
         """
         if cls._engine is None:
             cls._init_engine()
-        with Session(cls._engine) as session:
+        # expire_on_commit=False: 커밋 후 속성 접근이 재-SELECT를 유발하지 않음
+        # (서버 생성 컬럼은 eager_defaults 매퍼 설정이 INSERT RETURNING으로 회수)
+        with Session(cls._engine, expire_on_commit=False) as session:
+            yield session
+
+    @classmethod
+    def get_readonly_db(cls) -> Generator[Session, None, None]:
+        """
+        읽기 전용(GET) 경로용 AUTOCOMMIT 세션 생성기
+
+        단건 SELECT에도 BEGIN/ROLLBACK을 감싸는 기본 트랜잭션 모드와 달리
+        왕복 2회를 아낌. 쓰기 경로는 반드시 get_db()의 트랜잭션 세션 사용
+        """
+        if cls._engine is None:
+            cls._init_engine()
+        if cls._readonly_engine is None:
+            # execution_options는 풀을 공유하는 얇은 래퍼 엔진을 반환
+            cls._readonly_engine = cls._engine.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+        with Session(cls._readonly_engine) as session:
             yield session
 
     @classmethod
@@ -75,47 +117,64 @@ class PostgreDB:
         """
         if cls._engine is None:
             cls._init_engine()
-        return Session(cls._engine)
+        return Session(cls._engine, expire_on_commit=False)
 
     @classmethod
     def init_db(cls, session: Session | None = None):
         """
         데이터베이스 초기화 (테이블 생성 및 초기 superuser 생성)
-        여러 워커가 동시에 실행될 때 발생하는 중복 생성 문제 방지
+
+        Postgres advisory lock으로 리더 워커 하나만 DDL을 수행하고,
+        나머지 워커는 리더가 끝날 때까지 대기 후 카탈로그 스캔 없이 건너뜀
         """
         if cls._engine is None:
             cls._init_engine()
 
-        try:
-            # SQLModel 테이블 생성 (User 등)
-            SQLModel.metadata.create_all(bind=cls._engine, checkfirst=True)
+        cls._wait_until_ready()
+
+        with cls._engine.connect() as conn:
+            got_lock = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"),
+                {"key": cls.DDL_ADVISORY_LOCK_KEY},
+            ).scalar()
+
+            if not got_lock:
+                # 다른 워커가 DDL 수행 중 → 완료를 기다렸다가 즉시 반환
+                conn.execute(
+                    text("SELECT pg_advisory_lock(:key)"),
+                    {"key": cls.DDL_ADVISORY_LOCK_KEY},
+                )
+                conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": cls.DDL_ADVISORY_LOCK_KEY},
+                )
+                return
 
-            # TODO: 동시성 처리가 이래도 안된다면 롤백해야 함
-            from app.models.env_model import Base
+            try:
+                # SQLModel 테이블 생성 (User 등)
+                SQLModel.metadata.create_all(bind=cls._engine, checkfirst=True)
 
-            # checkfirst=True는 기본값이지만, 명시적으로 지정
-            # 이미 존재하는 테이블은 건너뛰고 새로운 테이블만 생성
-            Base.metadata.create_all(bind=cls._engine, checkfirst=True)
-            # TODO: LOG 추가 - print("✓ Database tables created successfully")
+                from app.models.env_model import Base
 
-            # 초기 superuser 생성
-            cls._create_initial_superuser(session)
+                # checkfirst=True는 기본값이지만, 명시적으로 지정
+                # 이미 존재하는 테이블은 건너뛰고 새로운 테이블만 생성
+                Base.metadata.create_all(bind=cls._engine, checkfirst=True)
+                # TODO: LOG 추가 - print("✓ Database tables created successfully")
 
-        except Exception as e:
-            # 동시성 문제로 인한 중복 키 오류는 무시 (테이블이 이미 존재함)
-            if "duplicate key" in str(e).lower() or "already exists" in str(e).lower():
-                # TODO: LOG 추가 - print("ℹ Database tables already exist, skipping creation")
-                pass
-            else:
-                # TODO: LOG 추가 - print(f"❌ Failed to create database tables: {e}")
-                raise
+                # 초기 superuser 생성
+                cls._create_initial_superuser(session)
+
+            finally:
+                conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": cls.DDL_ADVISORY_LOCK_KEY},
+                )
 
     @classmethod
     def _create_initial_superuser(cls, session: Session | None = None):
         """
         초기 superuser 생성
         """
-        from app.models.user_model import User
         from app.schemas.user_schema import UserCreate
         from app.services.user_service import UserService
 
@@ -143,6 +202,37 @@ class PostgreDB:
             if should_close:
                 session.close()
 
+    @classmethod
+    def warm_pool(cls, count: int | None = None):
+        """
+        커넥션 풀 예열 (pool_size만큼 미리 연결을 열어 풀에 적재)
+
+        첫 요청들이 TCP 핸드셰이크/인증 비용을 내지 않도록 기동 시 한 번 호출.
+        병렬로 열어야 풀이 실제로 채워지며(순차로는 같은 연결이 재사용됨),
+        전부 연 뒤 반환하면 풀에 유휴 연결로 남음
+        """
+        if cls._engine is None:
+            cls._init_engine()
+
+        if count is None:
+            count = settings.POSTGRES_POOL_SIZE
+
+        connections = []
+        try:
+            with ThreadPoolExecutor(max_workers=count) as executor:
+                for future in [
+                    executor.submit(cls._engine.connect) for _ in range(count)
+                ]:
+                    try:
+                        connections.append(future.result())
+                    except OperationalError:
+                        # 일부 연결 실패는 무시 (pool_pre_ping이 요청 시 보정)
+                        # TODO: LOG 추가 - print("⚠ Pool warm-up connection failed")
+                        pass
+        finally:
+            for conn in connections:
+                conn.close()
+
     @classmethod
     def close_db(cls):
         """
@@ -151,6 +241,8 @@ class PostgreDB:
         if cls._engine:
             cls._engine.dispose()
             cls._engine = None
+            # 읽기 전용 엔진은 같은 풀의 래퍼이므로 참조만 해제
+            cls._readonly_engine = None
             # TODO: LOG 추가 - print("✓ Database connection closed")
 
 
@@ -159,52 +251,5 @@ def depend_get_db() -> Generator[Session, None, None]:
     yield from PostgreDB.get_db()
 
 
-# OAuth2 토큰 URL 설정
-reusable_oauth2 = OAuth2PasswordBearer(
-    tokenUrl=f"{settings.API_V1_STR}/login/access-token"
-)
-
-# 타입 어노테이션
-SessionDep = Annotated[Session, Depends(depend_get_db)]
-TokenDep = Annotated[str, Depends(reusable_oauth2)]
-
-
-def get_current_user(session: SessionDep, token: TokenDep):
-    """현재 인증된 사용자 반환"""
-    from app.core import security
-    from app.models.user_model import User
-    from app.schemas.user_schema import TokenPayload
-
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-    except (InvalidTokenError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-        )
-    user = session.get(User, token_data.sub)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    if not user.is_active:
-        raise HTTPException(status_code=400, detail="Inactive user")
-    return user
-
-
-def get_current_active_superuser(
-    current_user: Annotated[object, Depends(get_current_user)],
-):
-    """현재 슈퍼유저 권한 확인"""
-    if not current_user.is_superuser:
-        raise HTTPException(
-            status_code=403, detail="The user doesn't have enough privileges"
-        )
-    return current_user
-
-
-# 타입 어노테이션 (라우터에서 import해서 사용)
-# Note: User 타입은 순환 import 방지를 위해 Any로 선언하고, 런타임에는 User 객체가 반환됨
-
-CurrentUser = Annotated[Any, Depends(get_current_user)]
+def depend_get_readonly_db() -> Generator[Session, None, None]:
+    yield from PostgreDB.get_readonly_db()
@@ -1,47 +1,72 @@
-import redis
+import random
 import time
 
+import redis
+
 from app.core.env import settings
 
 
 class RedisDB:
-    # Redis 싱글톤 객체
+    # Redis 싱글톤 객체 및 프로세스 공용 커넥션 풀
     _instance = None
+    _pool: redis.ConnectionPool | None = None
+    MAX_CONNECTIONS = 50
     MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
+    # 지수 백오프 + 지터 (동시 재기동 시 재연결 폭주 방지)
+    BASE_DELAY = 1.0  # seconds
+    MAX_DELAY = 30.0  # seconds
+    JITTER = 0.5
+
+    @classmethod
+    def _get_pool(cls) -> redis.ConnectionPool:
+        """
+        프로세스 공용 ConnectionPool 반환 (모든 클라이언트가 소켓을 공유)
+        """
+        if cls._pool is None:
+            cls._pool = redis.ConnectionPool(
+                host=settings.REDIS_HOST
+                if hasattr(settings, "REDIS_HOST")
+                else "redis",
+                port=settings.REDIS_PORT,
+                db=0,  # 환경변수 전용 DB
+                decode_responses=True,  # 문자열 자동 디코딩
+                max_connections=cls.MAX_CONNECTIONS,
+                socket_keepalive=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                retry_on_timeout=True,
+                health_check_interval=30,
+            )
+        return cls._pool
 
     @classmethod
     def get_instance(cls) -> redis.Redis:
         """
-        Redis 클라이언트 인스턴스 반환 (싱글톤, 재시도 로직 포함)
+        Redis 클라이언트 인스턴스 반환 (싱글톤, 지수 백오프 재시도 포함)
+
+        클라이언트는 공용 풀 위의 얇은 래퍼이므로 추가 TCP 연결 비용 없음
+        인증 실패는 재시도해도 소용없으므로 즉시 전파
         """
         if cls._instance is None:
             for attempt in range(1, cls.MAX_RETRIES + 1):
                 try:
-                    cls._instance = redis.Redis(
-                        host=settings.REDIS_HOST
-                        if hasattr(settings, "REDIS_HOST")
-                        else "redis",
-                        port=settings.REDIS_PORT,
-                        db=0,  # 환경변수 전용 DB
-                        decode_responses=True,  # 문자열 자동 디코딩
-                        socket_connect_timeout=5,
-                        socket_timeout=5,
-                        retry_on_timeout=True,
-                        health_check_interval=30,
-                    )
+                    cls._instance = redis.Redis(connection_pool=cls._get_pool())
 
                     # 연결 테스트
                     cls._instance.ping()
                     # TODO: LOG 추가(클라이언트 연결 성공)
                     return cls._instance
 
-                except Exception:
+                except redis.AuthenticationError:
+                    cls._instance = None
+                    raise
+
+                except (redis.ConnectionError, redis.TimeoutError):
                     # TODO: LOG 추가 - print(f"⚠ Redis connection attempt {attempt}/{cls.MAX_RETRIES} failed: {e}")
                     cls._instance = None
                     if attempt < cls.MAX_RETRIES:
-                        # TODO: LOG 추가 - print(f"   Retrying in {cls.RETRY_DELAY} seconds...")
-                        time.sleep(cls.RETRY_DELAY)
+                        delay = min(cls.MAX_DELAY, cls.BASE_DELAY * 2 ** (attempt - 1))
+                        time.sleep(delay * (1 + random.random() * cls.JITTER))
                     else:
                         # TODO: LOG 추가 - print(f"❌ Redis connection failed after {cls.MAX_RETRIES} attempts")
                         raise
@@ -51,11 +76,14 @@ class RedisDB:
     @classmethod
     def close(cls):
         """
-        Redis 연결 종료
+        Redis 연결 종료 (풀의 모든 소켓 반환)
         """
         if cls._instance is not None:
             cls._instance.close()
             cls._instance = None
+        if cls._pool is not None:
+            cls._pool.disconnect()
+            cls._pool = None
             # TODO: LOG 추가, ✓ Redis 클라이언트 연결 종료
 
     @classmethod
@@ -2,8 +2,11 @@
 FastAPI Main Application
 환경변수 및 인증 기능 통합
 """
+import re
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.env import settings
 from app.core.lifecycle import lifespan
@@ -19,23 +22,37 @@ app = FastAPI(
     description=settings.APP_DESCRIPTION,
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    # orjson 기반 직렬화 (stdlib json 대비 3~5배 빠름)
+    default_response_class=ORJSONResponse,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
 )
 
 
+# origin 목록을 단일 정규식으로 합쳐 요청마다 리스트 선형 탐색 대신
+# C 구현 re.match 한 번으로 매칭 (starlette은 allow_origin_regex를 1회 컴파일)
+_cors_origins = get_cors_origins()
+if "*" in _cors_origins:
+    _cors_kwargs = {"allow_origins": ["*"]}
+else:
+    _cors_kwargs = {
+        "allow_origin_regex": "^(?:"
+        + "|".join(re.escape(origin) for origin in _cors_origins)
+        + ")$"
+    }
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=get_cors_origins(),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    **_cors_kwargs,
 )
 
 
+# (router, prefix) 한 곳에서 관리 — 라우터 추가 시 아래 튜플에만 등록
 app.include_router(env_router.router)
-app.include_router(login_router.router, prefix=settings.API_V1_STR)
-app.include_router(signup_router.router, prefix=settings.API_V1_STR)
-app.include_router(user_router.router, prefix=settings.API_V1_STR)
+for module in (login_router, signup_router, user_router):
+    app.include_router(module.router, prefix=settings.API_V1_STR)
 
 
 # Health Check 엔드포인트
@@ -1,9 +1,9 @@
 """
 Environment Variable Model for PostgreSQL storage
 """
-from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Text
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql import func
 
 Base = declarative_base()
 
@@ -21,13 +21,26 @@ class EnvVariable(Base):
     """
 
     __tablename__ = "env_variables"
+    # 서버 생성 타임스탬프를 INSERT/UPDATE ... RETURNING으로 같은 왕복에 회수
+    # (커밋 후 refresh/재-SELECT 불필요)
+    __mapper_args__ = {"eager_defaults": True}
 
-    key = Column(String(255), primary_key=True, index=True, nullable=False)
+    # PK가 곧 unique B-tree 인덱스 — index=True를 더하면 같은 컬럼에
+    # 중복 인덱스가 생겨 쓰기마다 유지 비용만 추가됨
+    key = Column(String(255), primary_key=True, nullable=False)
     value = Column(Text, nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # 타임스탬프는 DB 서버에서 생성 (행마다 Python 기본값 호출 제거,
+    # bulk insert/upsert 경로에서도 기본값 보장)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    # server_onupdate만으로는 ORM UPDATE에 반영되지 않으므로 onupdate도 지정
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
     def __repr__(self):
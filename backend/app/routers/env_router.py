@@ -2,10 +2,13 @@
 Environment Variables API Router
 환경변수 CRUD API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from app.db.postgre_db import depend_get_db, get_current_active_superuser
+from app.core.deps import get_current_active_superuser
+from app.db.postgre_db import depend_get_db, depend_get_readonly_db
 from app.schemas.env_schema import (
     EnvVariableCreate,
     EnvVariableUpdate,
@@ -23,7 +26,14 @@ router = APIRouter(
 
 
 def get_env_service(db: Session = Depends(depend_get_db)) -> EnvVariableService:
-    """환경변수 서비스 의존성 주입"""
+    """환경변수 서비스 의존성 주입 (트랜잭션 세션, 쓰기 경로용)"""
+    return EnvVariableService(db)
+
+
+def get_readonly_env_service(
+    db: Session = Depends(depend_get_readonly_db),
+) -> EnvVariableService:
+    """환경변수 서비스 의존성 주입 (AUTOCOMMIT 세션, GET 경로용)"""
     return EnvVariableService(db)
 
 
@@ -31,12 +41,22 @@ def get_env_service(db: Session = Depends(depend_get_db)) -> EnvVariableService:
     "",
     response_model=EnvVariableListResponse,
     summary="모든 환경변수 조회",
-    description="모든 환경변수를 조회합니다.",
+    description="모든 환경변수를 페이지 단위로 조회합니다.",
 )
-async def get_all_env_variables(service: EnvVariableService = Depends(get_env_service)):
-    """모든 환경변수 조회"""
-    env_vars = service.get_all()
-    return EnvVariableListResponse(total=len(env_vars), items=env_vars)
+def get_all_env_variables(
+    limit: int = Query(100, ge=1, le=1000, description="최대 조회 개수"),
+    offset: int = Query(0, ge=0, description="건너뛸 개수"),
+    service: EnvVariableService = Depends(get_readonly_env_service),
+):
+    """모든 환경변수 조회 (페이지네이션)"""
+    # total은 count 쿼리로 계산 (전체 행을 메모리에 올리지 않음)
+    total = service.count()
+    env_vars = service.get_all(limit=limit, offset=offset)
+    payload = EnvVariableListResponse(total=total, items=env_vars)
+
+    # 이미 검증된 모델을 pydantic-core 직렬화기로 한 번만 인코딩하여 반환
+    # (Response를 직접 반환하면 FastAPI의 재검증/재인코딩을 건너뜀)
+    return Response(content=payload.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -45,8 +65,10 @@ async def get_all_env_variables(service: EnvVariableService = Depends(get_env_se
     summary="환경변수 단건 조회",
     description="특정 키의 환경변수를 조회합니다. (Redis 캐시 우선)",
 )
-async def get_env_variable(
-    key: str, service: EnvVariableService = Depends(get_env_service)
+def get_env_variable(
+    key: str,
+    request: Request,
+    service: EnvVariableService = Depends(get_readonly_env_service),
 ):
     """환경변수 조회"""
     env_var = service.get(key)
@@ -57,7 +79,26 @@ async def get_env_variable(
             detail=f"Environment variable '{key}' not found",
         )
 
-    return env_var
+    # 값+수정시각 기반 ETag — 폴링 클라이언트는 변경 없을 때
+    # 직렬화/본문 전송 없이 304로 응답
+    etag = '"{}"'.format(
+        hashlib.blake2b(
+            f"{env_var.updated_at.isoformat()}{env_var.value}".encode(),
+            digest_size=16,
+        ).hexdigest()
+    )
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    # 검증 1회 + 직렬화 1회로 응답 (response_model 재검증 생략)
+    payload = EnvVariableResponse.model_validate(env_var)
+    return Response(
+        content=payload.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.post(
@@ -67,7 +108,7 @@ async def get_env_variable(
     summary="환경변수 생성",
     description="새로운 환경변수를 생성합니다. (DB 저장 + Redis 캐시)",
 )
-async def create_env_variable(
+def create_env_variable(
     env_create: EnvVariableCreate,
     service: EnvVariableService = Depends(get_env_service),
 ):
@@ -85,7 +126,7 @@ async def create_env_variable(
     summary="환경변수 수정",
     description="기존 환경변수를 수정합니다. (DB 업데이트 + Redis 캐시 갱신)",
 )
-async def update_env_variable(
+def update_env_variable(
     key: str,
     env_update: EnvVariableUpdate,
     service: EnvVariableService = Depends(get_env_service),
@@ -111,7 +152,7 @@ async def update_env_variable(
     summary="환경변수 삭제",
     description="환경변수를 삭제합니다. (DB 삭제 + Redis 캐시 제거)",
 )
-async def delete_env_variable(
+def delete_env_variable(
     key: str, service: EnvVariableService = Depends(get_env_service)
 ):
     """환경변수 삭제"""
@@ -135,7 +176,7 @@ async def delete_env_variable(
     summary="DB → Redis 동기화",
     description="DB의 모든 환경변수를 Redis로 동기화합니다.",
 )
-async def sync_db_to_redis(service: EnvVariableService = Depends(get_env_service)):
+def sync_db_to_redis(service: EnvVariableService = Depends(get_env_service)):
     """DB → Redis 동기화"""
     success = service.sync_to_redis()
 
@@ -154,7 +195,7 @@ async def sync_db_to_redis(service: EnvVariableService = Depends(get_env_service
     summary=".env 파일 로드",
     description=".env 파일에서 환경변수를 로드하여 DB에 저장합니다.",
 )
-async def load_from_env_file(service: EnvVariableService = Depends(get_env_service)):
+def load_from_env_file(service: EnvVariableService = Depends(get_env_service)):
     """env 파일에서 로드"""
     count = service.load_from_env_file(".env")
 
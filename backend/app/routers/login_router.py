@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.core import security
-from app.db.postgre_db import CurrentUser, SessionDep
+from app.core.deps import CurrentUser, SessionDep
 from app.core.runtime_env import get_access_token_expire_minutes
 from app.schemas.user_schema import Token, UserPublic
 from app.services.user_service import UserService
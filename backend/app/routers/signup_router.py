@@ -1,8 +1,9 @@
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from sqlalchemy.exc import IntegrityError
 
-from app.db.postgre_db import SessionDep
+from app.core.deps import SessionDep
 from app.schemas.user_schema import UserCreate, UserPublic, UserRegister
 from app.services.user_service import UserService
 
@@ -15,17 +16,31 @@ def register_user(session: SessionDep, user_in: UserRegister) -> Any:
     """
     Public user registration with username, password, email, nickname.
     """
-    if UserService.get_user_by_email(session=session, email=user_in.email):
+    email_exists, username_exists = UserService.find_conflicts(
+        session=session, email=user_in.email, username=user_in.username
+    )
+    if email_exists:
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system",
         )
-    if UserService.get_user_by_username(session=session, username=user_in.username):
+    if username_exists:
         raise HTTPException(
             status_code=400,
             detail="The user with this username already exists in the system",
         )
 
-    user_create = UserCreate.model_validate(user_in)
-    user = UserService.create_user(session=session, user_create=user_create)
+    # 요청 파싱 시점에 이미 검증된 필드이므로 재검증 없이 복사만 수행
+    # (is_active/is_superuser는 model_construct가 기본값으로 채움)
+    user_create = UserCreate.model_construct(**user_in.model_dump())
+    try:
+        user = UserService.create_user(session=session, user_create=user_create)
+    except IntegrityError:
+        # SELECT와 INSERT 사이에 동일 email/username이 먼저 들어온 경우
+        # (unique 제약이 최종 방어선)
+        session.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="The user with this email or username already exists in the system",
+        )
     return user
@@ -4,7 +4,7 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import func, select
 
-from app.db.postgre_db import (
+from app.core.deps import (
     CurrentUser,
     SessionDep,
     get_current_active_superuser,
@@ -4,26 +4,33 @@ Redis Cache Manager for Environment Variables
 from typing import Optional, Dict
 import redis
 from app.db.redis_db import RedisDB
+from app.utils.ttl_cache import TTLCache
+
+# Redis 앞단의 프로세스 내 캐시 — 핫 키 반복 조회 시 네트워크 왕복(~100µs)을
+# dict 조회(~1µs)로 대체. 쓰기 경로에서 즉시 갱신/삭제되며, 다른 워커의
+# 변경은 TTL(5초) 안에 수렴함 (이 배포는 워커 수가 작아 Pub/Sub 무효화는
+# 과한 구성)
+_local = TTLCache(maxsize=1024, ttl=5.0)
 
 
 class EnvCacheService:
     """
     환경변수 Redis 캐시 관리 서비스
 
-    Redis를 1차 캐시로 사용하여 환경변수 조회 성능 최적화
+    모든 환경변수를 단일 HASH(env:all)의 필드로 저장하여
+    조회/저장/삭제/전체조회가 각각 O(1) 명령 + 1회 왕복으로 처리되며,
+    단건 조회는 프로세스 내 TTL 캐시가 한 번 더 흡수함
     """
 
-    # Redis 키 prefix
-    ENV_PREFIX = "env:"
+    # 환경변수 전체를 담는 Redis HASH 키
     ENV_ALL_KEY = "env:all"
+    # 행 메타데이터(JSON: description, 타임스탬프 포함)를 담는 HASH 키
+    # — 캐시 히트 시 PG 왕복 없이 전체 응답을 구성하기 위함
+    ENV_META_KEY = "env:meta"
 
     def __init__(self):
         self.redis_client: redis.Redis = RedisDB.get_instance()
 
-    def _make_key(self, key: str) -> str:
-        """Redis 키 생성"""
-        return f"{self.ENV_PREFIX}{key}"
-
     def get(self, key: str) -> Optional[str]:
         """
         환경변수 조회 (Redis 캐시에서)
@@ -34,9 +41,14 @@ class EnvCacheService:
         Returns:
             환경변수 값 또는 None
         """
+        local_value = _local.get(key)
+        if local_value is not None:
+            return local_value
+
         try:
-            redis_key = self._make_key(key)
-            value = self.redis_client.get(redis_key)
+            value = self.redis_client.hget(self.ENV_ALL_KEY, key)
+            if value is not None:
+                _local.set(key, value)
             return value
         except redis.RedisError:
             # Redis 오류 시 None 반환 (DB에서 조회하도록)
@@ -51,19 +63,8 @@ class EnvCacheService:
             환경변수 딕셔너리
         """
         try:
-            # Pattern matching으로 모든 env: 키 조회
-            pattern = f"{self.ENV_PREFIX}*"
-            keys = self.redis_client.keys(pattern)
-
-            result = {}
-            for redis_key in keys:
-                # env: prefix 제거
-                key = redis_key.replace(self.ENV_PREFIX, "")
-                value = self.redis_client.get(redis_key)
-                if value:
-                    result[key] = value
-
-            return result
+            # HGETALL 한 번으로 전체 조회 (SCAN/MGET 불필요)
+            return self.redis_client.hgetall(self.ENV_ALL_KEY)
         except redis.RedisError:
             # TODO: LOG 추가 - print(f"Redis get_all error: {e}")
             return {}
@@ -80,16 +81,50 @@ class EnvCacheService:
             성공 여부
         """
         try:
-            redis_key = self._make_key(key)
-            self.redis_client.set(redis_key, value)
+            self.redis_client.hset(self.ENV_ALL_KEY, key, value)
+            _local.set(key, value)
             return True
         except redis.RedisError:
             # TODO: LOG 추가 - print(f"Redis set error for key {key}: {e}")
             return False
 
+    def get_meta(self, key: str) -> Optional[str]:
+        """
+        환경변수 메타데이터 JSON 조회
+
+        Args:
+            key: 환경변수 키
+
+        Returns:
+            메타데이터 JSON 문자열 또는 None
+        """
+        try:
+            return self.redis_client.hget(self.ENV_META_KEY, key)
+        except redis.RedisError:
+            # TODO: LOG 추가 - print(f"Redis get_meta error for key {key}: {e}")
+            return None
+
+    def set_meta(self, key: str, meta_json: str) -> bool:
+        """
+        환경변수 메타데이터 JSON 저장
+
+        Args:
+            key: 환경변수 키
+            meta_json: 메타데이터 JSON 문자열
+
+        Returns:
+            성공 여부
+        """
+        try:
+            self.redis_client.hset(self.ENV_META_KEY, key, meta_json)
+            return True
+        except redis.RedisError:
+            # TODO: LOG 추가 - print(f"Redis set_meta error for key {key}: {e}")
+            return False
+
     def set_many(self, env_dict: Dict[str, str]) -> bool:
         """
-        여러 환경변수 일괄 캐시 저장
+        여러 환경변수 일괄 캐시 저장 (단일 HSET 명령)
 
         Args:
             env_dict: 환경변수 딕셔너리
@@ -98,11 +133,8 @@ class EnvCacheService:
             성공 여부
         """
         try:
-            pipeline = self.redis_client.pipeline()
-            for key, value in env_dict.items():
-                redis_key = self._make_key(key)
-                pipeline.set(redis_key, value)
-            pipeline.execute()
+            if env_dict:
+                self.redis_client.hset(self.ENV_ALL_KEY, mapping=env_dict)
             return True
         except redis.RedisError:
             # TODO: LOG 추가 - print(f"Redis set_many error: {e}")
@@ -119,8 +151,11 @@ class EnvCacheService:
             성공 여부
         """
         try:
-            redis_key = self._make_key(key)
-            self.redis_client.delete(redis_key)
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.hdel(self.ENV_ALL_KEY, key)
+            pipe.hdel(self.ENV_META_KEY, key)
+            pipe.execute()
+            _local.pop(key)
             return True
         except redis.RedisError:
             # TODO: LOG 추가 - print(f"Redis delete error for key {key}: {e}")
@@ -134,10 +169,9 @@ class EnvCacheService:
             성공 여부
         """
         try:
-            pattern = f"{self.ENV_PREFIX}*"
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                self.redis_client.delete(*keys)
+            # UNLINK는 실제 메모리 해제를 Redis 백그라운드로 미룸
+            self.redis_client.unlink(self.ENV_ALL_KEY, self.ENV_META_KEY)
+            _local.clear()
             return True
         except redis.RedisError:
             # TODO: LOG 추가 - print(f"Redis clear_all error: {e}")
@@ -154,11 +188,16 @@ class EnvCacheService:
             성공 여부
         """
         try:
-            # 기존 캐시 삭제
-            self.clear_all()
-            # 새로운 데이터 일괄 저장
-            return self.set_many(env_dict)
-        except Exception:
+            # UNLINK + HSET을 MULTI/EXEC 한 번에 실행
+            # (왕복 1회, 원자적 교체 — 캐시가 비어 있는 구간 없음)
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.unlink(self.ENV_ALL_KEY, self.ENV_META_KEY)
+            if env_dict:
+                pipe.hset(self.ENV_ALL_KEY, mapping=env_dict)
+            pipe.execute()
+            _local.clear()
+            return True
+        except redis.RedisError:
             # TODO: LOG 추가 - print(f"Redis sync_from_db error: {e}")
             return False
 
@@ -173,8 +212,7 @@ class EnvCacheService:
             존재 여부
         """
         try:
-            redis_key = self._make_key(key)
-            return self.redis_client.exists(redis_key) > 0
+            return bool(self.redis_client.hexists(self.ENV_ALL_KEY, key))
         except redis.RedisError:
             # TODO: LOG 추가 - print(f"Redis exists error for key {key}: {e}")
             return False
@@ -3,8 +3,78 @@
 DB의 환경변수를 .env 파일로 백업/동기화
 """
 import os
+import re
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional, Set
+
+# .env 키 형식 (영문/밑줄로 시작, 영문/숫자/밑줄) — 바이트 단위로 1회 매칭
+_KEY_RE = re.compile(rb"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# 따옴표 감싸기가 필요한 값 판별 (개별 in 검사 5회 대신 C 구현 스캔 1회)
+_NEEDS_QUOTE = re.compile(r"[\s$#\"']").search
+
+# 큰따옴표 값 내부의 이스케이프 해제 (\" → ", \\ → \)
+# — export가 기록한 이스케이프를 load가 되돌려야 왕복이 무손실
+_ESCAPED_CHAR = re.compile(r'\\(["\\])')
+
+
+def parse_env_file(
+    file_path: str, skip_keys: Optional[Set[str]] = None
+) -> Dict[str, str]:
+    """
+    .env 파일 단일 패스 파서 (dotenv_values 대체)
+
+    dotenv의 정규식 기반 다중 패스 파싱 대신 한 번의 순회로
+    주석/빈 줄 건너뛰기, 'export ' 접두사 제거, 첫 '=' 분리,
+    따옴표 제거, 비따옴표 값의 인라인 주석 제거를 처리
+
+    Args:
+        file_path: .env 파일 경로
+        skip_keys: 건너뛸 키 집합 — 병합 시 이미 확정된 키는
+            값 언쿼팅/주석 처리 비용 없이 파서 안에서 바로 건너뜀
+
+    Returns:
+        환경변수 딕셔너리
+    """
+    env_dict: Dict[str, str] = {}
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+
+            # 빈 줄이나 주석 무시
+            if not line or line.startswith("#"):
+                continue
+
+            # 셸 호환 'export KEY=...' 형식 허용
+            if line.startswith("export "):
+                line = line[7:].lstrip()
+
+            eq_idx = line.find("=")
+            if eq_idx <= 0:
+                continue
+
+            key = line[:eq_idx].strip()
+            if skip_keys is not None and key in skip_keys:
+                continue
+            value = line[eq_idx + 1 :].strip()
+
+            quote = value[:1]
+            if quote in ('"', "'") and len(value) >= 2 and value.endswith(quote):
+                # 양끝 따옴표 제거 (따옴표 안의 #은 값의 일부)
+                value = value[1:-1]
+                if quote == '"':
+                    # export_to_env_file이 이스케이프한 따옴표/역슬래시 복원
+                    value = _ESCAPED_CHAR.sub(r"\1", value)
+            else:
+                # 비따옴표 값은 공백 뒤 #부터 인라인 주석으로 간주
+                hash_idx = value.find(" #")
+                if hash_idx >= 0:
+                    value = value[:hash_idx].rstrip()
+
+            env_dict[key] = value
+
+    return env_dict
 
 
 class EnvSyncService:
@@ -30,27 +100,46 @@ class EnvSyncService:
             성공 여부
         """
         try:
-            # 기존 파일 백업
+            # 기존 파일 백업 — 하드링크로 기존 inode를 백업 이름에 연결
+            # (데이터 복사 없음, 이후 os.replace가 원본 쪽 링크만 교체)
             if backup and os.path.exists(output_path):
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = f"{output_path}.backup.{timestamp}"
-                os.rename(output_path, backup_path)
+                try:
+                    os.link(output_path, backup_path)
+                except OSError:
+                    # 하드링크 미지원 파일시스템(또는 교차 장치)은 복사로 폴백
+                    EnvSyncService._copy_file(output_path, backup_path)
                 # TODO: LOG 추가 - print(f"Backup created: {backup_path}")
 
-            # .env 파일 작성
-            with open(output_path, "w", encoding="utf-8") as f:
-                # 헤더 작성
-                f.write("# Environment Variables\n")
-                f.write(f"# Exported from Database at {datetime.now().isoformat()}\n")
-                f.write("# DO NOT EDIT MANUALLY - Changes will be overwritten\n\n")
-
-                # 환경변수 작성 (알파벳 순 정렬)
-                for key in sorted(env_dict.keys()):
-                    value = env_dict[key]
-                    # 특수문자나 공백이 있는 경우 따옴표로 감싸기
-                    if " " in value or any(c in value for c in ["$", "#", '"', "'"]):
-                        value = f'"{value}"'
-                    f.write(f"{key}={value}\n")
+            # 헤더 + 본문을 메모리에서 조립
+            # 키 순서는 딕셔너리 순서를 그대로 사용 — get_all_as_dict가
+            # DB ORDER BY로 이미 키순을 보장하므로 N-엔트리 복사 + Timsort 생략
+            lines = [
+                "# Environment Variables",
+                f"# Exported from Database at {datetime.now().isoformat()}",
+                "# DO NOT EDIT MANUALLY - Changes will be overwritten",
+                "",
+            ]
+            for key, value in env_dict.items():
+                # 특수문자나 공백이 있는 경우 따옴표로 감싸기
+                # (내부 역슬래시/따옴표는 이스케이프 — 파서가 복원)
+                if _NEEDS_QUOTE(value):
+                    value = '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+                lines.append(f"{key}={value}")
+
+            payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+            # 임시 파일에 1회 write + fsync 후 원자적 rename
+            # (syscall O(N)→O(1), 중간에 죽어도 반쪽짜리 .env가 남지 않음)
+            tmp_path = f"{output_path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, output_path)
 
             # TODO: LOG 추가 - print(f"Environment variables exported to {output_path} ({len(env_dict)} variables)")
             return True
@@ -59,6 +148,22 @@ class EnvSyncService:
             # TODO: LOG 추가 - print(f"Failed to export environment variables to {output_path}: {e}")
             return False
 
+    @staticmethod
+    async def export_to_env_file_async(
+        env_dict: Dict[str, str], output_path: str = ".env", backup: bool = True
+    ) -> bool:
+        """
+        export_to_env_file의 비동기 래퍼
+
+        async 컨텍스트(lifespan 등)에서 호출할 때 write/fsync가
+        이벤트 루프를 막지 않도록 워커 스레드에서 실행
+        """
+        import asyncio
+
+        return await asyncio.to_thread(
+            EnvSyncService.export_to_env_file, env_dict, output_path, backup
+        )
+
     @staticmethod
     def load_from_env_file(file_path: str = ".env") -> Dict[str, str]:
         """
@@ -70,16 +175,12 @@ class EnvSyncService:
         Returns:
             환경변수 딕셔너리
         """
-        from dotenv import dotenv_values
-
         if not os.path.exists(file_path):
             # TODO: LOG 추가 - print(f"Warning: {file_path} not found")
             return {}
 
         try:
-            env_dict = dotenv_values(file_path)
-            # None 값 제거
-            env_dict = {k: v for k, v in env_dict.items() if v is not None}
+            env_dict = parse_env_file(file_path)
             # TODO: LOG 추가 - print(f"Loaded {len(env_dict)} environment variables from {file_path}")
             return env_dict
 
@@ -103,16 +204,22 @@ class EnvSyncService:
             성공 여부
         """
         try:
-            source_dict = EnvSyncService.load_from_env_file(source_path)
             target_dict = EnvSyncService.load_from_env_file(target_path)
 
-            # 병합
             if overwrite:
                 # 소스가 대상을 덮어씀
+                source_dict = EnvSyncService.load_from_env_file(source_path)
                 merged = {**target_dict, **source_dict}
             else:
-                # 대상 우선 (중복 시 대상 값 유지)
-                merged = {**source_dict, **target_dict}
+                # 대상 우선 — 이미 확정된 키는 파서 단계에서 건너뛰어
+                # 중복 키의 언쿼팅/주석 처리 비용을 생략
+                if os.path.exists(source_path):
+                    source_only = parse_env_file(
+                        source_path, skip_keys=set(target_dict)
+                    )
+                else:
+                    source_only = {}
+                merged = {**target_dict, **source_only}
 
             # 병합 결과 저장
             return EnvSyncService.export_to_env_file(
@@ -140,30 +247,34 @@ class EnvSyncService:
             return False, [f"File not found: {file_path}"]
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-
-                    # 빈 줄이나 주석 무시
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # KEY=VALUE 형식 검증
-                    if "=" not in line:
-                        errors.append(f"Line {line_num}: Missing '=' separator")
-                        continue
-
-                    key, _ = line.split("=", 1)
-                    key = key.strip()
-
-                    # 키 검증
-                    if not key:
-                        errors.append(f"Line {line_num}: Empty key")
-                    elif not key.replace("_", "").isalnum():
-                        errors.append(
-                            f"Line {line_num}: Invalid key '{key}' "
-                            "(only alphanumeric and underscore allowed)"
-                        )
+            # 바이트 단위 단일 패스 (라인별 디코드/문자열 재할당 없음)
+            with open(file_path, "rb") as f:
+                data = f.read()
+
+            for line_num, line in enumerate(data.splitlines(), 1):
+                line = line.strip()
+
+                # 빈 줄이나 주석 무시
+                if not line or line[:1] == b"#":
+                    continue
+
+                # KEY=VALUE 형식 검증
+                eq_idx = line.find(b"=")
+                if eq_idx < 0:
+                    errors.append(f"Line {line_num}: Missing '=' separator")
+                    continue
+
+                key = line[:eq_idx].strip()
+
+                # 키 검증 (컴파일된 정규식 1회 매칭)
+                if not key:
+                    errors.append(f"Line {line_num}: Empty key")
+                elif not _KEY_RE.match(key):
+                    errors.append(
+                        f"Line {line_num}: Invalid key "
+                        f"'{key.decode('utf-8', 'replace')}' "
+                        "(only alphanumeric and underscore allowed)"
+                    )
 
             return len(errors) == 0, errors
 
@@ -181,15 +292,65 @@ class EnvSyncService:
         Returns:
             백업 파일 경로 리스트 (최신순)
         """
-        import glob
+        directory, base = os.path.split(base_path)
+        prefix = f"{base}.backup."
 
-        pattern = f"{base_path}.backup.*"
-        backup_files = glob.glob(pattern)
+        # scandir 한 번으로 이름 필터 + mtime 조회 (glob + getmtime의
+        # 파일당 중복 stat 제거 — scandir는 stat 결과를 캐싱함)
+        try:
+            with os.scandir(directory or ".") as it:
+                entries = [
+                    (
+                        entry.stat().st_mtime,
+                        os.path.join(directory, entry.name)
+                        if directory
+                        else entry.name,
+                    )
+                    for entry in it
+                    if entry.name.startswith(prefix)
+                ]
+        except FileNotFoundError:
+            return []
 
         # 수정 시간 기준 최신순 정렬
-        backup_files.sort(key=os.path.getmtime, reverse=True)
+        entries.sort(reverse=True)
+
+        return [path for _, path in entries]
 
-        return backup_files
+    @staticmethod
+    def _copy_file(src_path: str, dst_path: str) -> None:
+        """
+        파일 복사 (Linux에선 커널 내부 복사, 그 외엔 shutil.copy2 폴백)
+
+        copy_file_range는 유저스페이스 버퍼를 거치지 않고
+        (btrfs/xfs에선 reflink 가능) 커널 안에서 복사를 끝냄
+        """
+        import shutil
+
+        if not hasattr(os, "copy_file_range"):
+            shutil.copy2(src_path, dst_path)
+            return
+
+        try:
+            src_fd = os.open(src_path, os.O_RDONLY)
+            try:
+                dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    remaining = os.fstat(src_fd).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+            # copy2와 동일하게 메타데이터(mtime 등) 보존
+            shutil.copystat(src_path, dst_path)
+        except OSError:
+            # 파일시스템/커널이 지원하지 않는 경우
+            shutil.copy2(src_path, dst_path)
 
     @staticmethod
     def restore_from_backup(backup_path: str, target_path: str = ".env") -> bool:
@@ -216,9 +377,7 @@ class EnvSyncService:
                 # TODO: LOG 추가 - print(f"Safety backup created: {safety_backup}")
 
             # 백업에서 복원
-            import shutil
-
-            shutil.copy2(backup_path, target_path)
+            EnvSyncService._copy_file(backup_path, target_path)
             # TODO: LOG 추가 - print(f"Restored from {backup_path} to {target_path}")
             return True
 
@@ -2,7 +2,13 @@
 Environment Variable Database Service
 PostgreSQL을 이용한 환경변수 CRUD 작업 및 Redis 캐시 연동
 """
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -10,6 +16,56 @@ from app.core.env import settings
 from app.models.env_model import EnvVariable
 from app.schemas.env_schema import EnvVariableCreate, EnvVariableUpdate
 from app.services.env_services.env_cache import EnvCacheService
+from app.utils.ttl_cache import TTLCache
+
+# get_all_as_dict 결과 메모 (1초 창 안의 반복 전체 스캔을 1회로 축소)
+# 쓰기 경로(create/update/delete/bulk_upsert/load_from_env_file)에서 무효화
+_ALL_DICT_CACHE = TTLCache(maxsize=1, ttl=1.0)
+_ALL_DICT_KEY = "all"
+
+
+# 캐시 미스 후 역채움(write-back)은 응답 경로에서 떼어내 백그라운드로 수행
+# (단일 워커 스레드면 충분 — Redis set은 수십 µs, 순서도 보존됨)
+_CACHE_WRITEBACK = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="env-cache-writeback"
+)
+
+
+@lru_cache(maxsize=1)
+def _shared_cache() -> EnvCacheService:
+    """
+    프로세스 전역 Redis 캐시 서비스 (요청마다 클라이언트 재해결 방지)
+    """
+    return EnvCacheService()
+
+
+def _meta_blob(env_var: EnvVariable) -> str:
+    """EnvVariable 행 전체를 캐시용 JSON 문자열로 직렬화"""
+    return json.dumps(
+        {
+            "value": env_var.value,
+            "description": env_var.description,
+            "created_at": env_var.created_at.isoformat(),
+            "updated_at": env_var.updated_at.isoformat(),
+        },
+        separators=(",", ":"),
+    )
+
+
+def _from_meta_blob(key: str, meta_json: str) -> Optional[EnvVariable]:
+    """캐시된 JSON으로 세션에 붙지 않은(detached) EnvVariable 복원"""
+    try:
+        meta = json.loads(meta_json)
+        return EnvVariable(
+            key=key,
+            value=meta["value"],
+            description=meta["description"],
+            created_at=datetime.fromisoformat(meta["created_at"]),
+            updated_at=datetime.fromisoformat(meta["updated_at"]),
+        )
+    except (ValueError, KeyError, TypeError):
+        # 손상된 캐시 항목은 무시하고 DB 경로로 진행
+        return None
 
 
 class EnvVariableService:
@@ -18,11 +74,14 @@ class EnvVariableService:
 
     PostgreSQL을 영속 저장소로 사용하며,
     Redis 캐시와 자동 동기화
+
+    서비스 객체 자체는 요청 범위 세션만 담는 가벼운 래퍼이고,
+    Redis 캐시 서비스는 모듈 전역 싱글톤을 공유
     """
 
     def __init__(self, db: Session):
         self.db = db
-        self.cache = EnvCacheService()
+        self.cache = _shared_cache()
 
     def get(self, key: str) -> Optional[EnvVariable]:
         """
@@ -34,25 +93,54 @@ class EnvVariableService:
         Returns:
             EnvVariable 객체 또는 None
         """
-        # 1차: Redis 캐시에서 조회
+        # 1차: Redis 캐시 — 메타데이터 JSON까지 있으면 PG 왕복 없이 복원
         cached_value = self.cache.get(key)
         if cached_value is not None:
-            # 캐시 히트 - DB 객체 조회 (메타데이터 포함)
-            return self.db.query(EnvVariable).filter(EnvVariable.key == key).first()
+            meta_json = self.cache.get_meta(key)
+            if meta_json:
+                env_var = _from_meta_blob(key, meta_json)
+                if env_var is not None:
+                    return env_var
 
-        # 2차: DB에서 조회
-        env_var = self.db.query(EnvVariable).filter(EnvVariable.key == key).first()
+        # 2차: DB에서 조회 (PK 조회 — identity map 우선, 쿼리 빌더 생략)
+        env_var = self.db.get(EnvVariable, key)
 
-        # DB에 있으면 캐시에 저장
+        # DB에 있으면 캐시 역채움 (응답을 기다리게 하지 않도록 백그라운드 처리)
         if env_var:
-            self.cache.set(env_var.key, env_var.value)
+            _CACHE_WRITEBACK.submit(self.cache.set, env_var.key, env_var.value)
+            _CACHE_WRITEBACK.submit(
+                self.cache.set_meta, env_var.key, _meta_blob(env_var)
+            )
 
         return env_var
 
-    def get_all(self) -> list[EnvVariable]:
+    def get_value(self, key: str) -> Optional[str]:
+        """
+        환경변수 값만 조회하는 고속 경로 (캐시 히트 시 Redis만 사용)
+
+        Args:
+            key: 환경변수 키
+
+        Returns:
+            환경변수 값 또는 None
+        """
+        cached_value = self.cache.get(key)
+        if cached_value is not None:
+            return cached_value
+
+        env_var = self.get(key)
+        return env_var.value if env_var else None
+
+    def get_all(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> list[EnvVariable]:
         """
         RUNTIME_ENV_KEYS에 정의된 환경변수만 조회
 
+        Args:
+            limit: 최대 조회 개수 (None이면 전체)
+            offset: 건너뛸 개수
+
         Returns:
             EnvVariable 리스트 (RUNTIME_ENV_KEYS에 포함된 것만)
         """
@@ -60,8 +148,35 @@ class EnvVariableService:
         if not runtime_keys:
             return []
 
+        query = (
+            self.db.query(EnvVariable)
+            .filter(EnvVariable.key.in_(runtime_keys))
+            # PK B-tree로 정렬을 DB에 위임 (소비자 측 재정렬 불필요)
+            .order_by(EnvVariable.key)
+        )
+
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query.all()
+
+    def count(self) -> int:
+        """
+        RUNTIME_ENV_KEYS에 정의된 환경변수 개수 조회 (행 전체를 읽지 않음)
+
+        Returns:
+            환경변수 개수
+        """
+        runtime_keys = settings.RUNTIME_ENV_KEYS_LIST
+        if not runtime_keys:
+            return 0
+
         return (
-            self.db.query(EnvVariable).filter(EnvVariable.key.in_(runtime_keys)).all()
+            self.db.query(func.count(EnvVariable.key))
+            .filter(EnvVariable.key.in_(runtime_keys))
+            .scalar()
         )
 
     def create(self, env_create: EnvVariableCreate) -> EnvVariable:
@@ -77,10 +192,8 @@ class EnvVariableService:
         Raises:
             ValueError: 이미 존재하는 키인 경우
         """
-        # 중복 확인
-        existing = (
-            self.db.query(EnvVariable).filter(EnvVariable.key == env_create.key).first()
-        )
+        # 중복 확인 (PK 조회)
+        existing = self.db.get(EnvVariable, env_create.key)
 
         if existing:
             raise ValueError(f"Environment variable '{env_create.key}' already exists")
@@ -94,11 +207,14 @@ class EnvVariableService:
 
         try:
             self.db.add(env_var)
+            # eager_defaults 매퍼 설정으로 INSERT RETURNING이 타임스탬프를
+            # 같은 왕복에 채워주므로 refresh 불필요
             self.db.commit()
-            self.db.refresh(env_var)
 
-            # Redis 캐시에 저장
+            # Redis 캐시에 저장 (값 + 메타데이터)
             self.cache.set(env_var.key, env_var.value)
+            self.cache.set_meta(env_var.key, _meta_blob(env_var))
+            _ALL_DICT_CACHE.clear()
 
             return env_var
 
@@ -106,6 +222,50 @@ class EnvVariableService:
             self.db.rollback()
             raise ValueError(f"Failed to create environment variable: {str(e)}")
 
+    def bulk_upsert(self, env_creates: list[EnvVariableCreate]) -> int:
+        """
+        환경변수 일괄 업서트 (단일 INSERT ... ON CONFLICT 쿼리)
+
+        신규 키는 값/설명을 함께 저장하고,
+        기존 키는 값을 보존한 채 설명만 갱신 (설명이 None이면 기존 설명 유지)
+
+        Args:
+            env_creates: 업서트할 환경변수 데이터 목록
+
+        Returns:
+            처리된 환경변수 개수
+
+        Note:
+            Redis 캐시는 갱신하지 않으므로 필요 시 sync_to_redis() 호출
+        """
+        if not env_creates:
+            return 0
+
+        rows = [
+            {"key": e.key, "value": e.value, "description": e.description}
+            for e in env_creates
+        ]
+
+        stmt = pg_insert(EnvVariable).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EnvVariable.key],
+            set_={
+                "description": func.coalesce(
+                    stmt.excluded.description, EnvVariable.description
+                )
+            },
+        )
+
+        try:
+            self.db.execute(stmt)
+            self.db.commit()
+            _ALL_DICT_CACHE.clear()
+            return len(rows)
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise ValueError(f"Failed to upsert environment variables: {str(e)}")
+
     def update(self, key: str, env_update: EnvVariableUpdate) -> Optional[EnvVariable]:
         """
         환경변수 수정
@@ -117,7 +277,7 @@ class EnvVariableService:
         Returns:
             수정된 EnvVariable 객체 또는 None
         """
-        env_var = self.db.query(EnvVariable).filter(EnvVariable.key == key).first()
+        env_var = self.db.get(EnvVariable, key)
 
         if not env_var:
             return None
@@ -129,11 +289,13 @@ class EnvVariableService:
             env_var.description = env_update.description
 
         try:
+            # UPDATE ... RETURNING이 갱신된 updated_at을 같은 왕복에 채움
             self.db.commit()
-            self.db.refresh(env_var)
 
-            # Redis 캐시 갱신
+            # Redis 캐시 갱신 (값 + 메타데이터)
             self.cache.set(env_var.key, env_var.value)
+            self.cache.set_meta(env_var.key, _meta_blob(env_var))
+            _ALL_DICT_CACHE.clear()
 
             return env_var
 
@@ -151,7 +313,7 @@ class EnvVariableService:
         Returns:
             삭제 성공 여부
         """
-        env_var = self.db.query(EnvVariable).filter(EnvVariable.key == key).first()
+        env_var = self.db.get(EnvVariable, key)
 
         if not env_var:
             return False
@@ -162,6 +324,7 @@ class EnvVariableService:
 
             # Redis 캐시에서 삭제
             self.cache.delete(key)
+            _ALL_DICT_CACHE.clear()
 
             return True
 
@@ -176,8 +339,14 @@ class EnvVariableService:
         Returns:
             환경변수 딕셔너리 {key: value}
         """
+        cached = _ALL_DICT_CACHE.get(_ALL_DICT_KEY)
+        if cached is not None:
+            return cached
+
         env_vars = self.get_all()
-        return {env.key: env.value for env in env_vars}
+        env_dict = {env.key: env.value for env in env_vars}
+        _ALL_DICT_CACHE.set(_ALL_DICT_KEY, env_dict)
+        return env_dict
 
     def load_from_env_file(self, env_file_path: str = ".env") -> int:
         """
@@ -190,31 +359,34 @@ class EnvVariableService:
             로드된 환경변수 개수
         """
         import os
-        from dotenv import dotenv_values
+        from app.services.env_services.env_sync import parse_env_file
 
         if not os.path.exists(env_file_path):
             # TODO: LOG 추가 - print(f"Warning: {env_file_path} not found")
             return 0
 
-        env_dict = dotenv_values(env_file_path)
-        count = 0
-
-        for key, value in env_dict.items():
-            if not value:  # 빈 값 무시
-                continue
+        env_dict = parse_env_file(env_file_path)
+        rows = [
+            {"key": key, "value": value}
+            for key, value in env_dict.items()
+            if value  # 빈 값 무시
+        ]
 
-            # 이미 존재하는지 확인
-            existing = self.db.query(EnvVariable).filter(EnvVariable.key == key).first()
+        if not rows:
+            return 0
 
-            if not existing:
-                env_var = EnvVariable(key=key, value=value)
-                self.db.add(env_var)
-                count += 1
+        # 단일 INSERT ... ON CONFLICT DO NOTHING (N회 SELECT+INSERT 왕복 제거)
+        # .env는 초기값 공급원일 뿐이므로 기존 키의 런타임 수정값은 보존
+        stmt = pg_insert(EnvVariable).values(rows)
+        stmt = stmt.on_conflict_do_nothing(index_elements=[EnvVariable.key])
 
         try:
+            result = self.db.execute(stmt)
             self.db.commit()
-            # TODO: LOG 추가 - print(f"Loaded {count} environment variables from {env_file_path}")
-            return count
+            _ALL_DICT_CACHE.clear()
+            # rowcount = 실제 삽입된 행 수 (충돌로 건너뛴 행 제외)
+            # TODO: LOG 추가 - print(f"Loaded {result.rowcount} environment variables from {env_file_path}")
+            return result.rowcount
         except SQLAlchemyError:
             self.db.rollback()
             # TODO: LOG 추가 - print(f"Failed to load environment variables: {e}")
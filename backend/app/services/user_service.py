@@ -1,25 +1,64 @@
 """
 Service layer for user CRUD and authentication helpers.
 """
+import hashlib
+import hmac
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlmodel import Session, or_, select
 
-from app.core.security import get_password_hash, verify_password
+from app.core.env import settings
+from app.core.security import (
+    get_password_hash,
+    get_password_hash_fast,
+    verify_password,
+)
+from app.db.redis_db import RedisDB
 from app.models.user_model import User
 from app.schemas.user_schema import UserCreate, UserUpdate
 
+# 재인증 결과 캐시: (username, password) → user id
+# TTL을 짧게 유지해 비밀번호 변경이 수 초 안에 반영되도록 함
+_AUTH_CACHE_TTL = 5  # seconds
+# 자격증명은 SECRET_KEY를 pepper로 쓰는 HMAC으로만 키에 들어감 (평문 미저장)
+_AUTH_PEPPER = settings.SECRET_KEY.encode("utf-8")
+
+
+# 대량 검증용 워커 풀 — bcrypt C 확장이 해싱 중 GIL을 해제하므로
+# 스레드만으로도 코어 수만큼 병렬화됨 (프로세스 풀의 pickle 비용 불필요)
+_KDF_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="kdf"
+)
+
+
+def _auth_cache_key(username: str, password: str) -> str:
+    digest = hmac.new(
+        _AUTH_PEPPER, f"{username}:{password}".encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+    return f"auth:{digest}"
+
 
 class UserService:
     @staticmethod
-    def create_user(*, session: Session, user_create: UserCreate) -> User:
+    def create_user(
+        *,
+        session: Session,
+        user_create: UserCreate,
+        hash_profile: str = "interactive",
+    ) -> User:
+        # "bulk"은 대량 시드/가져오기 전용 저비용 해싱 프로필
+        # (security.get_password_hash_fast의 보안 트레이드오프 참고)
+        hasher = get_password_hash_fast if hash_profile == "bulk" else get_password_hash
         db_obj = User.model_validate(
             user_create,
-            update={"hashed_password": get_password_hash(user_create.password)},
+            update={"hashed_password": hasher(user_create.password)},
         )
         session.add(db_obj)
         session.commit()
-        session.refresh(db_obj)
+        # expire_on_commit=False 세션이므로 refresh(추가 SELECT) 불필요
         return db_obj
 
     @staticmethod
@@ -33,7 +72,6 @@ class UserService:
         db_user.sqlmodel_update(user_data, update=extra_data)
         session.add(db_user)
         session.commit()
-        session.refresh(db_user)
         return db_user
 
     @staticmethod
@@ -46,11 +84,79 @@ class UserService:
         statement = select(User).where(User.username == username)
         return session.exec(statement).first()
 
+    @staticmethod
+    def find_conflicts(
+        *, session: Session, email: str, username: str
+    ) -> tuple[bool, bool]:
+        """Check email/username uniqueness with a single round-trip.
+
+        Returns (email_exists, username_exists).
+        """
+        statement = select(User.email, User.username).where(
+            or_(User.email == email, User.username == username)
+        )
+        email_exists = False
+        username_exists = False
+        for row_email, row_username in session.exec(statement):
+            if row_email == email:
+                email_exists = True
+            if row_username == username:
+                username_exists = True
+        return email_exists, username_exists
+
     @staticmethod
     def authenticate(*, session: Session, username: str, password: str) -> User | None:
+        # 1차: 최근 성공한 동일 자격증명이면 bcrypt(~100ms) 생략
+        cache_key = _auth_cache_key(username, password)
+        try:
+            cached_id = RedisDB.get_instance().get(cache_key)
+        except Exception:  # Redis 불가 시 정상 경로로 진행
+            cached_id = None
+
+        if cached_id:
+            user = session.get(User, uuid.UUID(cached_id))
+            if user:
+                return user
+
         db_user = UserService.get_user_by_username(session=session, username=username)
         if not db_user:
             return None
         if not verify_password(password, db_user.hashed_password):
             return None
+
+        try:
+            RedisDB.get_instance().setex(cache_key, _AUTH_CACHE_TTL, str(db_user.id))
+        except Exception:
+            pass
+
         return db_user
+
+    @staticmethod
+    def authenticate_many(
+        *, session: Session, credentials: list[tuple[str, str]]
+    ) -> list[User | None]:
+        """Verify a batch of (username, password) pairs.
+
+        Fetches all candidate users with one IN query, then runs the
+        bcrypt verifications in parallel across CPU cores. Intended for
+        bulk flows (imports, seeding); single logins use authenticate().
+
+        Returns a list aligned with the input: the matched User or None.
+        """
+        if not credentials:
+            return []
+
+        usernames = [username for username, _ in credentials]
+        users_by_name = {
+            user.username: user
+            for user in session.exec(select(User).where(User.username.in_(usernames)))
+        }
+
+        def _check(pair: tuple[str, str]) -> User | None:
+            username, password = pair
+            user = users_by_name.get(username)
+            if user and verify_password(password, user.hashed_password):
+                return user
+            return None
+
+        return list(_KDF_POOL.map(_check, credentials))
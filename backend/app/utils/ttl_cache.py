@@ -0,0 +1,68 @@
+"""
+In-process TTL Cache
+Redis/DB 앞단에서 사용하는 프로세스 내 1차 캐시
+"""
+import threading
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    스레드 안전한 소형 TTL 캐시
+
+    짧은 TTL 동안 조회 결과를 프로세스 메모리에 보관하여
+    핫 키 조회 시 Redis/DB 왕복을 생략하기 위한 용도
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시 조회 (만료되었거나 없으면 default 반환)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        캐시 저장 (가득 찬 경우 만료 항목 → 오래된 항목 순으로 제거)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                expired = [k for k, (exp, _) in self._data.items() if now >= exp]
+                for k in expired:
+                    del self._data[k]
+
+                if len(self._data) >= self.maxsize:
+                    self._data.pop(next(iter(self._data)))
+
+            self._data[key] = (now + self.ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        캐시 항목 제거 (없으면 무시)
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        캐시 전체 비우기
+        """
+        with self._lock:
+            self._data.clear()